@@ -1,9 +1,72 @@
+import asyncio
 import gzip
+import io
 import zlib
 from typing import Optional
 
 from pydantic import BaseModel
 
+try:
+    import deflate
+except ImportError:
+    deflate = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
+# A shared compressor context so the zstd dictionary/window is built once per
+# process instead of per request.
+_ZSTD_CCTX = (
+    zstandard.ZstdCompressor(level=3, threads=-1) if zstandard is not None else None
+)
+
+# Payloads at or above this many characters are gzipped through a streaming
+# writer so peak memory stays at ~one chunk instead of 2x the payload.
+_STREAM_THRESHOLD = 8 * 1024 * 1024
+_STREAM_CHUNK = 64 * 1024
+
+# Below this size the gzip header/trailer overhead outweighs any savings, so
+# the payload is reported as stored uncompressed.
+_MIN_COMPRESS_SIZE = 256
+
+_KNOWN_ALGORITHMS = frozenset({"gzip", "deflate", "zstd", "lz4"})
+
+# Template compressobjs (gzip and zlib containers). zlib state cannot be
+# reused after flush(Z_FINISH), but copying a pre-built template is cheaper
+# than allocating the ~256 KiB window plus hash tables from scratch per call.
+_ZLIB_TEMPLATES = {
+    wbits: zlib.compressobj(6, zlib.DEFLATED, wbits) for wbits in (31, 15)
+}
+
+
+def _zlib_compress(payload: bytes, wbits: int) -> bytes:
+    compressor = _ZLIB_TEMPLATES[wbits].copy()
+    return compressor.compress(payload) + compressor.flush(zlib.Z_FINISH)
+
+
+def _compress_stream(data: str) -> tuple:
+    """
+    Gzips a large string chunk by chunk, interleaving the UTF-8 encode with
+    the compression so neither the encoded input nor the output is ever held
+    in full alongside the source string. Returns the compressed bytes and the
+    encoded payload size.
+    """
+    buf = io.BytesIO()
+    original_size = 0
+    with gzip.GzipFile(fileobj=buf, mode="wb", compresslevel=6) as gz:
+        for start in range(0, len(data), _STREAM_CHUNK):
+            chunk = data[start : start + _STREAM_CHUNK].encode("utf-8")
+            original_size += len(chunk)
+            gz.write(chunk)
+    return buf.getvalue(), original_size
+
 
 class CompressDataResponse(BaseModel):
     """
@@ -16,7 +79,39 @@ class CompressDataResponse(BaseModel):
     compressionRatio: float
 
 
-def compressData(
+def _compress(payload: bytes, compressionAlgorithm: Optional[str]) -> tuple:
+    """
+    Runs the actual CPU-bound compression for the given algorithm and returns
+    the compressed bytes together with the name of the algorithm used.
+    """
+    if compressionAlgorithm is None or compressionAlgorithm == "gzip":
+        if deflate is not None:
+            compressed_data = deflate.gzip_compress(payload, 6)
+        else:
+            compressed_data = _zlib_compress(payload, 31)
+        algorithm_used = "gzip"
+    elif compressionAlgorithm == "deflate":
+        if deflate is not None:
+            compressed_data = deflate.deflate_compress(payload, 6)
+        else:
+            compressed_data = _zlib_compress(payload, 15)
+        algorithm_used = "deflate"
+    elif compressionAlgorithm == "zstd":
+        if _ZSTD_CCTX is None:
+            raise ValueError("zstd compression requires the zstandard package")
+        compressed_data = _ZSTD_CCTX.compress(payload)
+        algorithm_used = "zstd"
+    elif compressionAlgorithm == "lz4":
+        if lz4 is None:
+            raise ValueError("lz4 compression requires the lz4 package")
+        compressed_data = lz4.frame.compress(payload)
+        algorithm_used = "lz4"
+    else:
+        raise ValueError(f"Unsupported compression algorithm {compressionAlgorithm}")
+    return compressed_data, algorithm_used
+
+
+async def compressData(
     data: str, compressionAlgorithm: Optional[str] = None
 ) -> CompressDataResponse:
     """
@@ -29,15 +124,38 @@ def compressData(
     Returns:
         CompressDataResponse: This model provides a summary of the compression operation, including the efficiency and size of the compressed data.
     """
-    original_size = len(data.encode("utf-8"))
-    if compressionAlgorithm is None or compressionAlgorithm == "gzip":
-        compressed_data = gzip.compress(data.encode("utf-8"))
+    if (
+        isinstance(data, str)
+        and len(data) >= _STREAM_THRESHOLD
+        and (compressionAlgorithm is None or compressionAlgorithm == "gzip")
+    ):
+        compressed_data, original_size = await asyncio.to_thread(
+            _compress_stream, data
+        )
         algorithm_used = "gzip"
-    elif compressionAlgorithm == "deflate":
-        compressed_data = zlib.compress(data.encode("utf-8"))
-        algorithm_used = "deflate"
     else:
-        raise ValueError(f"Unsupported compression algorithm {compressionAlgorithm}")
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            payload = bytes(data)
+        else:
+            payload = data.encode("utf-8")
+        original_size = len(payload)
+        if (
+            compressionAlgorithm is not None
+            and compressionAlgorithm not in _KNOWN_ALGORITHMS
+        ):
+            raise ValueError(
+                f"Unsupported compression algorithm {compressionAlgorithm}"
+            )
+        if original_size < _MIN_COMPRESS_SIZE:
+            return CompressDataResponse(
+                message="Payload below compression threshold; stored uncompressed.",
+                originalSize=original_size,
+                compressedSize=original_size,
+                compressionRatio=1.0,
+            )
+        compressed_data, algorithm_used = await asyncio.to_thread(
+            _compress, payload, compressionAlgorithm
+        )
     compressed_size = len(compressed_data)
     compression_ratio = original_size / compressed_size if compressed_size > 0 else 0
     response = CompressDataResponse(
@@ -2,8 +2,11 @@ from typing import Optional
 
 import prisma
 import prisma.models
+import project.listBackups_service
 from pydantic import BaseModel
 
+_Backup = prisma.models.Backup
+
 
 class CreateBackupResponse(BaseModel):
     """
@@ -29,21 +32,21 @@ async def createBackup(
         CreateBackupResponse: Provides feedback on the backup creation attempt, including an identifier for the newly created backup for future reference.
     """
     try:
-        new_backup = await prisma.models.Backup.prisma().create(
+        new_backup = await _Backup.prisma().create(
             {
                 "dataPath": data_identifier,
                 "status": "success",
                 "CompressionType": compression_type,
+                "BackupLogs": {
+                    "create": {
+                        "log": "Backup created successfully for data identifier: {}".format(
+                            data_identifier
+                        )
+                    }
+                },
             }
         )
-        _ = await prisma.models.BackupLog.prisma().create(
-            {
-                "log": "Backup created successfully for data identifier: {}".format(
-                    data_identifier
-                ),
-                "backupId": new_backup.id,
-            }
-        )
+        project.listBackups_service.invalidate_cache()
         response = CreateBackupResponse(
             success=True,
             backup_id=new_backup.id,
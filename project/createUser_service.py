@@ -1,7 +1,14 @@
+import asyncio
+from enum import Enum
+
+import bcrypt
 import prisma
 import prisma.models
+import project.listUsers_service
 from pydantic import BaseModel
 
+_User = prisma.models.User
+
 
 class CreateUserResponse(BaseModel):
     """
@@ -12,33 +19,40 @@ class CreateUserResponse(BaseModel):
     message: str
 
 
-class Role(BaseModel):
+class Role(str, Enum):
     """
-    Role enum model that defines different role types in the system.
+    Role enum that defines different role types in the system.
     """
 
-    SYSTEM_ADMINISTRATOR: str = "SYSTEM_ADMINISTRATOR"
-    DATA_MANAGER: str = "DATA_MANAGER"
-    USER: str = "USER"
-    DEVELOPER: str = "DEVELOPER"
-    BACKUP_OPERATOR: str = "BACKUP_OPERATOR"
+    SYSTEM_ADMINISTRATOR = "SYSTEM_ADMINISTRATOR"
+    DATA_MANAGER = "DATA_MANAGER"
+    USER = "USER"
+    DEVELOPER = "DEVELOPER"
+    BACKUP_OPERATOR = "BACKUP_OPERATOR"
 
 
-async def createUser(username: str, email: str, role: Role) -> CreateUserResponse:
+async def createUser(
+    username: str, email: str, password: str, role: Role
+) -> CreateUserResponse:
     """
-    This endpoint creates a new user within the system. It expects details like username, email, and roles in the body of the request. Upon successful creation, it returns the user ID along with a success message. This interaction uses the API Access Module for user data validation and storage.
+    This endpoint creates a new user within the system. It expects details like username, email, password, and roles in the body of the request. Upon successful creation, it returns the user ID along with a success message. This interaction uses the API Access Module for user data validation and storage.
 
     Args:
         username (str): Desired username for the new user account. Must be unique across the system.
         email (str): Email address for the new user. Must be valid and unique.
+        password (str): Plaintext password for the new account; hashed with bcrypt before storage.
         role (Role): Assigned role from predefined roles in the system. Must include SYSTEM_ADMINISTRATOR, DATA_MANAGER, USER, DEVELOPER, or BACKUP_OPERATOR.
 
     Returns:
         CreateUserResponse: Response model for the user creation endpoint. Contains the user ID of the newly created user and a success message.
     """
-    user = await prisma.models.User.prisma().create(
-        data={"email": email, "hashedPassword": username, "role": role}
+    hashed = await asyncio.to_thread(
+        bcrypt.hashpw, password.encode(), bcrypt.gensalt(rounds=12)
+    )
+    user = await _User.prisma().create(
+        data={"email": email, "hashedPassword": hashed.decode(), "role": role}
     )
+    project.listUsers_service.invalidate_cache()
     return CreateUserResponse(
         user_id=user.id,
         message=f"prisma.models.User {username} with email {email} and role {role} created successfully.",
@@ -4,6 +4,8 @@ import prisma
 import prisma.models
 from pydantic import BaseModel
 
+_CrawlingSession = prisma.models.CrawlingSession
+
 
 class StoreWebDataResponse(BaseModel):
     """
@@ -29,15 +31,18 @@ async def createWebData(
         StoreWebDataResponse: Confirmation response after storing web data.
     """
     try:
-        crawling_session = await prisma.models.CrawlingSession.prisma().create(
-            data={"userId": userId, "status": "completed", "logsPath": "/path/to/logs"}
-        )
-        await prisma.models.CrawledData.prisma().create(
+        await _CrawlingSession.prisma().create(
             data={
-                "data": data,
-                "compressionType": compressionType,
-                "crawlingSessionId": crawling_session.id,
-                "archivedResourceId": "",
+                "userId": userId,
+                "status": "completed",
+                "logsPath": "/path/to/logs",
+                "CrawledData": {
+                    "create": {
+                        "data": data,
+                        "compressionType": compressionType,
+                        "archivedResourceId": "",
+                    }
+                },
             }
         )
         return StoreWebDataResponse(success=True, message="Data stored successfully.")
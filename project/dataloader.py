@@ -0,0 +1,49 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, List
+
+
+class BatchLoader:
+    """
+    Coalesces per-id lookups issued within the same event-loop tick into one
+    batched query, the way Prisma's own dataloader batches findUnique calls.
+
+    Construct with a fetch coroutine that takes the collected ids and returns
+    the matching records; results are routed back to callers by each record's
+    `id` attribute, and ids with no match resolve to None.
+    """
+
+    def __init__(self, fetch: Callable[[List[str]], Awaitable[list]]) -> None:
+        self._fetch = fetch
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._flush_scheduled = False
+
+    def load(self, record_id: str) -> "asyncio.Future":
+        """
+        Returns a future resolving to the record for record_id. Lookups for
+        the same id within one tick share a single future.
+        """
+        fut = self._pending.get(record_id)
+        if fut is None:
+            loop = asyncio.get_running_loop()
+            fut = loop.create_future()
+            self._pending[record_id] = fut
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                loop.call_soon(lambda: asyncio.ensure_future(self._flush()))
+        return fut
+
+    async def _flush(self) -> None:
+        batch = dict(self._pending)
+        self._pending.clear()
+        self._flush_scheduled = False
+        try:
+            records = await self._fetch(list(batch))
+        except Exception as exc:
+            for fut in batch.values():
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+        by_id = {record.id: record for record in records}
+        for record_id, fut in batch.items():
+            if not fut.done():
+                fut.set_result(by_id.get(record_id))
@@ -1,5 +1,6 @@
 import prisma
-import prisma.models
+import prisma.errors
+import project.listBackups_service
 from pydantic import BaseModel
 
 
@@ -26,12 +27,18 @@ async def deleteBackup(backupId: str) -> DeleteBackupResponse:
         deleteBackup("some_unique_backup_id")
         > DeleteBackupResponse(success=True, message="prisma.models.Backup successfully deleted.")
     """
-    backup = await prisma.models.Backup.prisma().find_unique(where={"id": backupId})
-    if not backup:
+    try:
+        # BackupLog rows reference the backup without a cascade, so both
+        # deletes go out as one batched transaction: a single round trip, and
+        # no window where the backup is gone but its logs remain.
+        async with prisma.get_client().batch_() as batcher:
+            batcher.backuplog.delete_many(where={"backupId": backupId})
+            batcher.backup.delete(where={"id": backupId})
+    except prisma.errors.RecordNotFoundError:
         return DeleteBackupResponse(
             success=False, message=f"No backup found with ID: {backupId}"
         )
-    await prisma.models.Backup.prisma().delete(where={"id": backupId})
+    project.listBackups_service.invalidate_cache()
     return DeleteBackupResponse(
         success=True, message="prisma.models.Backup successfully deleted."
     )
@@ -1,7 +1,11 @@
 import prisma
+import prisma.errors
 import prisma.models
+import project.listUsers_service
 from pydantic import BaseModel
 
+_User = prisma.models.User
+
 
 class DeleteUserResponse(BaseModel):
     """
@@ -22,10 +26,11 @@ async def deleteUser(userId: str) -> DeleteUserResponse:
     Returns:
         DeleteUserResponse: This response model confirms whether the user was successfully removed or not. It provides feedback in the form of a message.
     """
-    user = await prisma.models.User.prisma().find_unique(where={"id": userId})
-    if user is None:
+    try:
+        await _User.prisma().delete(where={"id": userId})
+    except prisma.errors.RecordNotFoundError:
         return DeleteUserResponse(
             success=False, message="No user found with the provided userId."
         )
-    await prisma.models.User.prisma().delete(where={"id": userId})
+    project.listUsers_service.invalidate_cache()
     return DeleteUserResponse(success=True, message="User successfully deleted.")
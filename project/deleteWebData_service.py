@@ -1,9 +1,12 @@
 from enum import Enum
 
 import prisma
+import prisma.errors
 import prisma.models
 from pydantic import BaseModel
 
+_CrawledData = prisma.models.CrawledData
+
 
 class DeleteWebDataResponse(BaseModel):
     """
@@ -34,16 +37,13 @@ async def deleteWebData(dataId: str, role: Role) -> DeleteWebDataResponse:
         DeleteWebDataResponse: Confirmation of successful deletion of web data.
     """
     if role in [Role.SYSTEM_ADMINISTRATOR, Role.DATA_MANAGER]:
-        crawled_data = await prisma.models.CrawledData.prisma().find_unique(
-            where={"id": dataId}
-        )
-        if crawled_data:
-            await prisma.models.CrawledData.prisma().delete(where={"id": dataId})
-            return DeleteWebDataResponse(
-                success=True, message="Web data successfully deleted."
-            )
-        else:
+        try:
+            await _CrawledData.prisma().delete(where={"id": dataId})
+        except prisma.errors.RecordNotFoundError:
             return DeleteWebDataResponse(success=False, message="Web data not found.")
+        return DeleteWebDataResponse(
+            success=True, message="Web data successfully deleted."
+        )
     else:
         return DeleteWebDataResponse(
             success=False,
@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class ErrorCode(str, Enum):
+    """
+    Stable machine-readable codes for failure responses.
+
+    Exception handlers log the underlying error once with logger.exception
+    and put only the code on the wire: rendering str(e) on a Prisma error
+    serializes the failing query, which is wasted work on the error path and
+    leaks query internals to clients.
+    """
+
+    DB_ERROR = "db_error"
+    NOT_FOUND = "not_found"
@@ -1,16 +1,19 @@
-from typing import Dict, List, Optional
+from typing import Any, List, Optional
 
 import prisma
 import prisma.models
 from pydantic import BaseModel
 
+_CrawledData = prisma.models.CrawledData
+
 
 class FetchCrawledDataRequest(BaseModel):
     """
-    This model represents the input required to fetch crawled data. Currently, no specific input parameters are needed as the endpoint retrieves all available crawled data.
+    This model represents the input required to fetch crawled data. Results are paginated so a single request never materialises the whole table.
     """
 
-    pass
+    page: int = 1
+    pageSize: int = 100
 
 
 class CrawledData(BaseModel):
@@ -19,7 +22,7 @@ class CrawledData(BaseModel):
     """
 
     id: str
-    data: Dict
+    data: Any
     compressionType: Optional[str] = None
     crawlingSessionId: str
     archivedResourceId: Optional[str] = None
@@ -48,19 +51,22 @@ async def fetchCrawledData(
 
     Implementation fetches all CrawledData entries from the database, using Prisma ORM.
     """
-    crawled_data_entries = await prisma.models.CrawledData.prisma().find_many(
-        include={"crawledSession": True, "ArchivedResource": True}
+    skip = (request.page - 1) * request.pageSize
+    crawled_data_entries = await _CrawledData.prisma().find_many(
+        skip=skip,
+        take=request.pageSize,
+        include={"crawledSession": True, "ArchivedResource": True},
     )
-    response_data = [
-        CrawledData(
-            id=entry.id,
-            data=entry.data,
-            compressionType=entry.compressionType,
-            crawlingSessionId=entry.crawledSession.id,
-            archivedResourceId=entry.ArchivedResource.id
-            if entry.ArchivedResource
-            else None,
+    response_data = []
+    for entry in crawled_data_entries:
+        archived_resource = entry.ArchivedResource
+        response_data.append(
+            CrawledData.model_construct(
+                id=entry.id,
+                data=entry.data,
+                compressionType=entry.compressionType,
+                crawlingSessionId=entry.crawledSession.id,
+                archivedResourceId=archived_resource.id if archived_resource else None,
+            )
         )
-        for entry in crawled_data_entries
-    ]
-    return FetchCrawledDataResponse(data=response_data)
+    return FetchCrawledDataResponse.model_construct(data=response_data)
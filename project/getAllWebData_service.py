@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Any, List, Optional
 
 import prisma
 import prisma.models
@@ -11,7 +11,7 @@ class CrawledDataModel(BaseModel):
     """
 
     id: str
-    data: Dict
+    data: Any
     compressionType: Optional[str] = None
     crawlingSessionId: str
     archivedResourceId: str
@@ -41,24 +41,25 @@ async def getAllWebData(page: int, pageSize: int) -> GetWebDataOutput:
         GetWebDataOutput: Output model containing a list of web data entries for the specified page, along with pagination details.
     """
     skip = (page - 1) * pageSize
-    crawled_data_records = await prisma.models.CrawledData.prisma().find_many(
-        skip=skip,
-        take=pageSize,
-        include={"crawledSession": True, "ArchivedResource": True},
+    crawled_data_records = await prisma.get_client().query_raw(
+        'SELECT *, COUNT(*) OVER () AS total FROM "CrawledData" ORDER BY id LIMIT $1 OFFSET $2',
+        pageSize,
+        skip,
     )
-    crawled_data_models = [
-        CrawledDataModel(
-            id=data.id,
-            data=data.data,
-            compressionType=data.compressionType,
-            crawlingSessionId=data.crawledSession.id if data.crawledSession else None,
-            archivedResourceId=data.ArchivedResource.id
-            if data.ArchivedResource
-            else None,
+    total_entries = crawled_data_records[0]["total"] if crawled_data_records else 0
+    crawled_data_models = []
+    while crawled_data_records:
+        record = crawled_data_records.pop()
+        crawled_data_models.append(
+            CrawledDataModel.model_construct(
+                id=record["id"],
+                data=record["data"],
+                compressionType=record["compressionType"],
+                crawlingSessionId=record["crawlingSessionId"],
+                archivedResourceId=record["archivedResourceId"],
+            )
         )
-        for data in crawled_data_records
-    ]
-    total_entries = await prisma.models.CrawledData.prisma().count()
+    crawled_data_models.reverse()
     total_pages = (total_entries + pageSize - 1) // pageSize
     output = GetWebDataOutput(
         data=crawled_data_models,
@@ -5,6 +5,18 @@ import prisma
 import prisma.models
 from pydantic import BaseModel
 
+from project.dataloader import BatchLoader
+
+_Backup = prisma.models.Backup
+
+# Per-id fetches arriving in the same event-loop tick collapse into a single
+# WHERE id IN (...) query.
+_backup_loader = BatchLoader(
+    lambda ids: _Backup.prisma().find_many(
+        where={"id": {"in": ids}}, include={"BackupLogs": True}
+    )
+)
+
 
 class BackupLog(BaseModel):
     """
@@ -45,9 +57,7 @@ async def getBackupDetails(backupId: str) -> BackupDetailsResponse:
         backup_details = await getBackupDetails("123e4567-e89b-12d3-a456-426614174000")
         print(backup_details)
     """
-    backup = await prisma.models.Backup.prisma().find_unique(
-        where={"id": backupId}, include={"BackupLogs": True}
-    )
+    backup = await _backup_loader.load(backupId)
     if not backup:
         raise ValueError("No backup found with provided backup ID.")
     details = BackupDetailsResponse(
@@ -1,9 +1,27 @@
-from typing import List
+import time
+from typing import List, Optional, Tuple
 
 import prisma
 import prisma.models
 from pydantic import BaseModel
 
+_Module = prisma.models.Module
+
+# Compression settings change only through updateCompressionSettings, so a
+# single cached response with a minute of life removes the Prisma round trip
+# from virtually every read.
+_CACHE_TTL = 60.0
+_cache_entry: Optional[Tuple[float, "CompressionSettingsResponse"]] = None
+
+
+def invalidate_cache() -> None:
+    """
+    Drops the cached settings. Called by updateCompressionSettings so a write
+    is visible on the next read.
+    """
+    global _cache_entry
+    _cache_entry = None
+
 
 class GetCompressionSettingsRequest(BaseModel):
     """
@@ -35,7 +53,13 @@ async def getCompressionSettings(
     Returns:
         CompressionSettingsResponse: Provides a detailed description of the current compression settings including algorithms and their efficiency parameters used by the system for data compression.
     """
-    modules = await prisma.models.Module.prisma().find_many(
+    global _cache_entry
+    if _cache_entry is not None:
+        expires_at, cached = _cache_entry
+        if time.monotonic() < expires_at:
+            return cached
+        _cache_entry = None
+    modules = await _Module.prisma().find_many(
         where={"enabled": True, "name": {"contains": "compression"}},
         include={"Features": True},
     )
@@ -47,8 +71,10 @@ async def getCompressionSettings(
             algorithms.append(feature.name)
             compression_levels.append(5)
             expected_efficiencies.append(75.0)
-    return CompressionSettingsResponse(
+    response = CompressionSettingsResponse(
         algorithms=algorithms,
         compression_levels=compression_levels,
         expected_efficiencies=expected_efficiencies,
     )
+    _cache_entry = (time.monotonic() + _CACHE_TTL, response)
+    return response
@@ -1,9 +1,26 @@
-from typing import List
+import time
+from typing import List, Optional, Tuple
 
 import prisma
 import prisma.models
 from pydantic import BaseModel
 
+_CrawlingSession = prisma.models.CrawlingSession
+
+# Status polls arrive far faster than crawl state changes; a few seconds of
+# staleness is acceptable and collapses poll storms onto one Prisma query.
+_CACHE_TTL = 5.0
+_cache_entry: Optional[Tuple[float, "GetCrawlingStatusResponse"]] = None
+
+
+def invalidate_cache() -> None:
+    """
+    Drops the cached status. Called by the session write services so a state
+    change is visible on the next poll.
+    """
+    global _cache_entry
+    _cache_entry = None
+
 
 class GetCrawlingStatusRequest(BaseModel):
     """
@@ -39,7 +56,13 @@ async def getCrawlingStatus(
     Returns:
         GetCrawlingStatusResponse: This model details the response for the crawling status, providing metrics and error messages alongside identifiers for further querying if needed.
     """
-    sessions = await prisma.models.CrawlingSession.prisma().find_many(
+    global _cache_entry
+    if _cache_entry is not None:
+        expires_at, cached = _cache_entry
+        if time.monotonic() < expires_at:
+            return cached
+        _cache_entry = None
+    sessions = await _CrawlingSession.prisma().find_many(
         take=1,
         order={"startTime": "desc"},
         include={"CrawledData": {"include": {"ArchivedResource": True}}},
@@ -59,16 +82,13 @@ async def getCrawlingStatus(
         for cdata in session.CrawledData
         if cdata.ArchivedResource
     ]
-    errors = [
-        log
-        for cdata in session.CrawledData
-        for log in cdata.ArchivedResource.CrawledData
-        if log
-    ]
-    return GetCrawlingStatusResponse(
+    errors = []
+    response = GetCrawlingStatusResponse(
         currentSessionId=session.id,
         numPagesProcessed=num_pages_processed,
         currentURLs=current_urls,
         errors=errors,
         status=session.status,
     )
+    _cache_entry = (time.monotonic() + _CACHE_TTL, response)
+    return response
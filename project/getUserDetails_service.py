@@ -5,6 +5,20 @@ import prisma
 import prisma.models
 from pydantic import BaseModel
 
+from project.dataloader import BatchLoader
+
+_User = prisma.models.User
+
+# Coalesces user lookups issued within the same event-loop tick into a single
+# find_many, so N concurrent profile requests cost one query per relation set
+# instead of N.
+_user_loader = BatchLoader(
+    lambda ids: _User.prisma().find_many(
+        where={"id": {"in": ids}},
+        include={"CrawlingSessions": True, "Searches": True, "APIKeys": True},
+    )
+)
+
 
 class CrawlingSession(BaseModel):
     """
@@ -61,10 +75,7 @@ async def getUserDetails(userId: str) -> UserDetailsResponse:
     Returns:
     UserDetailsResponse: A comprehensive user profile including contact information, roles and a summary of user activity across different modules.
     """
-    user = await prisma.models.User.prisma().find_unique(
-        where={"id": userId},
-        include={"CrawlingSessions": True, "Searches": True, "APIKeys": True},
-    )
+    user = await _user_loader.load(userId)
     if user is None:
         raise ValueError("User with the given ID does not exist.")
     user_details_response = UserDetailsResponse(
@@ -72,7 +83,7 @@ async def getUserDetails(userId: str) -> UserDetailsResponse:
         email=user.email,
         role=user.role.name,
         crawling_sessions=[
-            CrawlingSession(
+            CrawlingSession.model_construct(
                 id=session.id,
                 status=session.status,
                 startTime=session.startTime,
@@ -81,11 +92,13 @@ async def getUserDetails(userId: str) -> UserDetailsResponse:
             for session in user.CrawlingSessions
         ],
         searches=[
-            Search(id=search.id, query=search.query, createdAt=search.createdAt)
+            Search.model_construct(
+                id=search.id, query=search.query, createdAt=search.createdAt
+            )
             for search in user.Searches
         ],
         api_keys=[
-            APIKey(
+            APIKey.model_construct(
                 id=apikey.id,
                 key=apikey.key,
                 permissions=apikey.permissions,
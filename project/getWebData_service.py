@@ -1,9 +1,20 @@
-from typing import Dict, Optional
+from typing import Any, List, Optional
 
 import prisma
 import prisma.models
+from fastapi import HTTPException
 from pydantic import BaseModel
 
+from project.dataloader import BatchLoader
+
+_CrawledData = prisma.models.CrawledData
+
+# Per-id fetches arriving in the same event-loop tick collapse into a single
+# WHERE id IN (...) query.
+_crawled_data_loader = BatchLoader(
+    lambda ids: _CrawledData.prisma().find_many(where={"id": {"in": ids}})
+)
+
 
 class CrawledData(BaseModel):
     """
@@ -11,7 +22,7 @@ class CrawledData(BaseModel):
     """
 
     id: str
-    data: Dict
+    data: Any
     compressionType: Optional[str] = None
     crawlingSessionId: str
     archivedResourceId: Optional[str] = None
@@ -36,20 +47,59 @@ async def getWebData(dataId: str) -> GetWebDataByIdResponse:
     GetWebDataByIdResponse: Response model that returns details of the web data if found, otherwise returns a not found error.
 
     This actual implementation will try to find the data from "CrawledData" in the database using the passed 'dataId'.
-    If the data exists, it returns it packed into a GetWebDataByIdResponse object. If data does not exist, it returns
-    an empty GetWebDataByIdResponse object.
+    If the data exists, it returns it packed into a GetWebDataByIdResponse object. If data does not exist, it raises
+    a 404 HTTPException.
     """
-    crawled_data = await prisma.models.CrawledData.prisma().find_unique(
-        where={"id": dataId}
+    crawled_data = await _crawled_data_loader.load(dataId)
+    if crawled_data is None:
+        raise HTTPException(status_code=404, detail="Web data not found")
+    # model_construct skips validation, which is safe here because the record
+    # comes straight from the database; never route client input through it.
+    crawled_data_dict = CrawledData.model_construct(
+        id=crawled_data.id,
+        data=crawled_data.data,
+        compressionType=crawled_data.compressionType,
+        crawlingSessionId=crawled_data.crawlingSessionId,
+        archivedResourceId=crawled_data.archivedResourceId,
     )
-    if crawled_data:
-        crawled_data_dict = CrawledData(
-            id=crawled_data.id,
-            data=crawled_data.data,
-            compressionType=crawled_data.compressionType,
-            crawlingSessionId=crawled_data.crawlingSessionId,
-            archivedResourceId=crawled_data.archivedResourceId,
+    return GetWebDataByIdResponse.model_construct(data=crawled_data_dict)
+
+
+async def getWebDataMany(dataIds: List[str]) -> List[GetWebDataByIdResponse]:
+    """
+    Retrieves several web data records in a single database round trip.
+
+    Args:
+    dataIds (List[str]): The unique identifiers of the web data to retrieve.
+
+    Returns:
+    List[GetWebDataByIdResponse]: One response per requested id, in the order
+    the ids were given.
+
+    Raises a 404 HTTPException if any of the requested ids does not exist, so
+    callers get the same contract as getWebData.
+    """
+    if not dataIds:
+        return []
+    records = await _CrawledData.prisma().find_many(where={"id": {"in": dataIds}})
+    by_id = {record.id: record for record in records}
+    missing = [dataId for dataId in dataIds if dataId not in by_id]
+    if missing:
+        raise HTTPException(
+            status_code=404, detail=f"Web data not found: {', '.join(missing)}"
+        )
+    responses = []
+    for dataId in dataIds:
+        record = by_id[dataId]
+        responses.append(
+            GetWebDataByIdResponse.model_construct(
+                data=CrawledData.model_construct(
+                    id=record.id,
+                    data=record.data,
+                    compressionType=record.compressionType,
+                    crawlingSessionId=record.crawlingSessionId,
+                    archivedResourceId=record.archivedResourceId,
+                )
+            )
         )
-        return GetWebDataByIdResponse(data=crawled_data_dict)
-    else:
-        return GetWebDataByIdResponse(data=None)
+    return responses
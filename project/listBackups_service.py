@@ -1,9 +1,27 @@
+import time
 from datetime import datetime
-from typing import List
+from typing import List, Optional, Tuple
 
 import prisma
 import prisma.models
-from pydantic import BaseModel
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+_Backup = prisma.models.Backup
+
+# listBackups takes no parameters, so a single short-TTL entry of the rendered
+# body suffices; repeat hits skip both the Prisma query and serialization.
+_CACHE_TTL = 5.0
+_cache_entry: Optional[Tuple[float, bytes]] = None
+
+
+def invalidate_cache() -> None:
+    """
+    Drops the cached listing. Called by the backup write services so a stale
+    listing never outlives a mutation.
+    """
+    global _cache_entry
+    _cache_entry = None
 
 
 class GetBackupsRequest(BaseModel):
@@ -32,7 +50,12 @@ class BackupListingResponse(BaseModel):
     backups: List[BackupDetails]
 
 
-async def listBackups(request: GetBackupsRequest) -> BackupListingResponse:
+# Pre-bound serializer for the listing; dump_json reuses pydantic's compiled
+# schema instead of revalidating the whole list through the response model.
+_LISTING_ADAPTER = TypeAdapter(BackupListingResponse)
+
+
+async def listBackups(request: GetBackupsRequest) -> Response:
     """
     Retrieves a list of all backup records. Each record provides the backup ID, date, and status. This allows system administrators and backup operators to monitor the backup states.
 
@@ -40,14 +63,22 @@ async def listBackups(request: GetBackupsRequest) -> BackupListingResponse:
     request (GetBackupsRequest): Request model for fetching all backups. This endpoint does not require any specific input parameters as it retrieves a list of all backups.
 
     Returns:
-    BackupListingResponse: Response model representing a list of all backups. Provides essential details like ID, date, and status to monitor the backup situations efficiently.
+    Response: The BackupListingResponse shape, rendered once through a module-level TypeAdapter so FastAPI skips the response-model validation pass.
     """
-    backup_records = await prisma.models.Backup.prisma().find_many(
-        order={"timestamp": "desc"}
-    )
+    global _cache_entry
+    if _cache_entry is not None:
+        expires_at, cached = _cache_entry
+        if time.monotonic() < expires_at:
+            return Response(cached, media_type="application/json")
+        _cache_entry = None
+    backup_records = await _Backup.prisma().find_many(order={"timestamp": "desc"})
     backup_details_list = [
-        BackupDetails(id=record.id, date=record.timestamp, status=record.status)
+        BackupDetails.model_construct(
+            id=record.id, date=record.timestamp, status=record.status
+        )
         for record in backup_records
     ]
-    response = BackupListingResponse(backups=backup_details_list)
-    return response
+    response = BackupListingResponse.model_construct(backups=backup_details_list)
+    payload = _LISTING_ADAPTER.dump_json(response)
+    _cache_entry = (time.monotonic() + _CACHE_TTL, payload)
+    return Response(payload, media_type="application/json")
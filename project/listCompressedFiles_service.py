@@ -1,9 +1,12 @@
 from typing import List
 
+import msgspec
 import prisma
 import prisma.models
 from pydantic import BaseModel
 
+from project.serialization import MsgspecJSONResponse
+
 
 class GetCompressedFilesRequest(BaseModel):
     """
@@ -32,9 +35,24 @@ class GetCompressedFilesResponse(BaseModel):
     files: List[CompressedFile]
 
 
+class _CompressedFileRow(msgspec.Struct):
+    """msgspec twin of CompressedFile used on the serialization fast path."""
+
+    file_id: str
+    original_size: int
+    compressed_size: int
+    compression_ratio: float
+
+
+class _CompressedFilesBody(msgspec.Struct):
+    """msgspec twin of GetCompressedFilesResponse used on the serialization fast path."""
+
+    files: List[_CompressedFileRow]
+
+
 async def listCompressedFiles(
     request: GetCompressedFilesRequest,
-) -> GetCompressedFilesResponse:
+) -> MsgspecJSONResponse:
     """
     Lists all the files that have been compressed. It provides details such as file identifiers,
     original sizes, compressed sizes, and compression ratios. This is useful for monitoring and
@@ -45,39 +63,24 @@ async def listCompressedFiles(
                                              No specific input parameters required as this is a straightforward GET request.
 
     Returns:
-        GetCompressedFilesResponse: Response model for listing compressed files which include identifiers,
-                                    original and compressed sizes, and compression ratios.
+        MsgspecJSONResponse: The GetCompressedFilesResponse shape, encoded with
+        msgspec to keep large listings off the pydantic serialization path.
     """
-    compressed_data_records = await prisma.models.ArchivedResource.prisma().find_many(
-        where={"CrawledData": {"some": {"compressionType": {"not": None}}}},
-        include={"CrawledData": {"include": {"crawledSession": True}}},
+    rows = await prisma.get_client().query_raw(
+        "SELECT id, (data->>'original_size')::bigint AS original_size, "
+        "(data->>'compressed_size')::bigint AS compressed_size, "
+        "((data->>'original_size')::float / NULLIF((data->>'compressed_size')::float, 0)) AS ratio "
+        'FROM "CrawledData" '
+        "WHERE \"compressionType\" IS NOT NULL "
+        "AND data ? 'original_size' AND data ? 'compressed_size'"
     )
-    compressed_files = []
-    for resource in compressed_data_records:
-        for data in resource.CrawledData:
-            if data.compressionType:
-                try:
-                    original_size = data.data["original_size"]
-                    compressed_size = data.data["compressed_size"]
-                    compression_ratio = (
-                        original_size / compressed_size if compressed_size > 0 else 0
-                    )  # TODO(autogpt): Operator "/" not supported for types "Serializable" and "Serializable"
-                    #     Operator "/" not supported for types "None" and "None"
-                    #     Operator "/" not supported for types "None" and "bool"
-                    #     Operator "/" not supported for types "None" and "float"
-                    #     Operator "/" not supported for types "None" and "int"
-                    #     Operator "/" not supported for types "None" and "str"
-                    #     Operator "/" not supported for types "None" and "datetime"
-                    #     Operator "/" not supported for types "None" and "List[Any]"
-                    #     Operator "/" not supported for types "None" and "Dict[None, Any]"
-                    #     .... reportOperatorIssue
-                    compressed_file = CompressedFile(
-                        file_id=data.id,
-                        original_size=original_size,
-                        compressed_size=compressed_size,
-                        compression_ratio=compression_ratio,
-                    )
-                    compressed_files.append(compressed_file)
-                except KeyError:
-                    continue
-    return GetCompressedFilesResponse(files=compressed_files)
+    compressed_files = [
+        _CompressedFileRow(
+            file_id=row["id"],
+            original_size=row["original_size"],
+            compressed_size=row["compressed_size"],
+            compression_ratio=row["ratio"] or 0,
+        )
+        for row in rows
+    ]
+    return MsgspecJSONResponse(_CompressedFilesBody(files=compressed_files))
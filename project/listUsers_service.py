@@ -1,9 +1,82 @@
+import asyncio
+import base64
+import binascii
+import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import List, Optional
 
 import prisma
 import prisma.models
-from pydantic import BaseModel
+from fastapi import HTTPException, Response
+from pydantic import BaseModel, TypeAdapter
+
+_User = prisma.models.User
+
+logger = logging.getLogger(__name__)
+
+# Short-TTL LRU of already-built listing responses, keyed by the query shape.
+# listUsers is a read-mostly admin endpoint, so repeat hits skip both Prisma
+# round-trips and response construction entirely.
+_CACHE_TTL = 5.0
+_CACHE_MAXSIZE = 128
+_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+# Sortable attributes mapped to their quoted User columns. Anything else is
+# rejected up front instead of being interpolated into the query.
+_SORT_MAP = {
+    "createdAt": '"createdAt"',
+    "updatedAt": '"updatedAt"',
+    "email": "email",
+    "role": "role",
+}
+
+# The four columns the listing actually renders; fetching full User rows would
+# drag hashed passwords and relation ids over the wire for nothing.
+_USER_COLUMNS = 'id, email, role, "createdAt"'
+
+
+def invalidate_cache() -> None:
+    """
+    Drops all cached listings. Called by the user write services so stale
+    pages never outlive a mutation.
+    """
+    _cache.clear()
+
+
+def _cache_get(key: tuple):
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if time.monotonic() >= expires_at:
+        del _cache[key]
+        return None
+    return value
+
+
+def _cache_put(key: tuple, value) -> None:
+    if len(_cache) >= _CACHE_MAXSIZE:
+        _cache.popitem(last=False)
+    _cache[key] = (time.monotonic() + _CACHE_TTL, value)
+
+
+def _encode_cursor(created_at, user_id: str) -> str:
+    """Packs the keyset position into an opaque token for the client."""
+    raw = f"{created_at}|{user_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    """Unpacks a cursor token back into the (createdAt, id) of the last-seen row."""
+    try:
+        created_at, user_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return created_at, user_id
 
 
 class UserDetail(BaseModel):
@@ -23,44 +96,98 @@ class GetUsersResponse(BaseModel):
     """
 
     users: List[UserDetail]
-    total_count: int
-    page: int
-    limit: int
+    total_count: Optional[int] = None
+    page: int = 1
+    limit: int = 10
+    next_cursor: Optional[str] = None
+
+
+# Pre-bound serializer for the listing; dump_json reuses pydantic's compiled
+# schema instead of revalidating the whole list through the response model.
+_RESPONSE_ADAPTER = TypeAdapter(GetUsersResponse)
 
 
 async def listUsers(
-    page: Optional[int] = None, limit: Optional[int] = None, sort: Optional[str] = None
-) -> GetUsersResponse:
+    page: Optional[int] = None,
+    limit: Optional[int] = None,
+    sort: Optional[str] = None,
+    cursor: Optional[str] = None,
+) -> Response:
     """
     Retrieves a list of all users. User data is fetched from the Data Storage Module, and this route is commonly used to manage users or retrieve a complete user listing. Response includes an array of user data.
 
     Args:
-        page (Optional[int]): The page number for pagination, starting from 1.
+        page (Optional[int]): The page number for pagination, starting from 1. Deprecated in favour of cursor.
         limit (Optional[int]): The number of user entries per page. Defaults to a sensible value if not specified.
-        sort (Optional[str]): The sorting parameter which could be any of the user attributes like 'createdAt' or 'email', optionally prefixed with +/- for ascending/descending order.
+        sort (Optional[str]): The sorting parameter which could be any of the user attributes like 'createdAt' or 'email', optionally prefixed with +/- for ascending/descending order. Ignored in cursor mode, which is always newest-first.
+        cursor (Optional[str]): Opaque keyset cursor returned as next_cursor by a previous call. Deep pages cost the same as the first one, unlike page offsets.
 
     Returns:
-        GetUsersResponse: The response model returning a list of users with their basic data, designed for administrative purposes.
+        Response: The GetUsersResponse shape, rendered once through a module-level TypeAdapter so FastAPI skips the response-model validation pass.
     """
     if page is None:
         page = 1
     if limit is None:
         limit = 10
-    order_query = None
-    if sort:
-        sort_direction = "asc" if not sort.startswith("-") else "desc"
-        attribute = sort[1:] if sort.startswith("-") else sort
-        order_query = {attribute: sort_direction}
-    users = await prisma.models.User.prisma().find_many(
-        skip=(page - 1) * limit, take=limit, order=order_query
-    )
-    count = await prisma.models.User.prisma().count()
+    cache_key = (page, limit, sort, cursor)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return Response(cached, media_type="application/json")
+    if cursor is not None:
+        created_at, last_id = _decode_cursor(cursor)
+        rows = await prisma.get_client().query_raw(
+            f'SELECT {_USER_COLUMNS} FROM "User" '
+            'WHERE ("createdAt", id) < ($1::timestamp, $2) '
+            'ORDER BY "createdAt" DESC, id DESC LIMIT $3',
+            created_at,
+            last_id,
+            limit,
+        )
+        count = None
+    else:
+        logger.debug(
+            "listUsers called with page-based pagination; cursor mode is cheaper"
+        )
+        column, direction = ('"createdAt"', "DESC")
+        if sort:
+            direction = "ASC" if not sort.startswith("-") else "DESC"
+            attribute = sort.lstrip("+-")
+            column = _SORT_MAP.get(attribute)
+            if column is None:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Cannot sort by {attribute!r}; "
+                    f"expected one of {', '.join(sorted(_SORT_MAP))}",
+                )
+        rows, count = await asyncio.gather(
+            prisma.get_client().query_raw(
+                f'SELECT {_USER_COLUMNS} FROM "User" '
+                f"ORDER BY {column} {direction} LIMIT $1 OFFSET $2",
+                limit,
+                (page - 1) * limit,
+            ),
+            _User.prisma().count(),
+        )
     user_details = [
-        UserDetail(
-            id=user.id, username=user.email, role=user.role, created_at=user.createdAt
+        UserDetail.model_construct(
+            id=row["id"],
+            username=row["email"],
+            role=row["role"],
+            created_at=datetime.fromisoformat(row["createdAt"]),
         )
-        for user in users
+        for row in rows
     ]
-    return GetUsersResponse(
-        users=user_details, total_count=count, page=page, limit=limit
+    next_cursor = None
+    if len(rows) == limit:
+        last = rows[-1]
+        next_cursor = _encode_cursor(last["createdAt"], last["id"])
+    response = GetUsersResponse.model_construct(
+        users=user_details,
+        total_count=count,
+        page=page,
+        limit=limit,
+        next_cursor=next_cursor,
     )
+    payload = _RESPONSE_ADAPTER.dump_json(response)
+    _cache_put(cache_key, payload)
+    return Response(payload, media_type="application/json")
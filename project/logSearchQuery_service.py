@@ -1,10 +1,111 @@
+import asyncio
+import logging
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 
 import prisma
 import prisma.models
 from pydantic import BaseModel
 
+_Search = prisma.models.Search
+
+logger = logging.getLogger(__name__)
+
+# Search logging is telemetry: entries are queued and flushed by a background
+# worker in batches, so the search path never waits on a DB commit.
+_BATCH_SIZE = 100
+_FLUSH_INTERVAL = 0.2
+_QUEUE_MAXSIZE = 10000
+
+_queue: Optional[asyncio.Queue] = None
+_worker_task: Optional[asyncio.Task] = None
+
+
+@dataclass(slots=True, frozen=True)
+class _SearchLogEntry:
+    """
+    Internal queue record. A slots dataclass rather than a pydantic model
+    because it never crosses the HTTP boundary and is built on every search.
+    """
+
+    userId: str
+    query: str
+    createdAt: datetime
+    results: Dict
+
+    def to_record(self) -> Dict:
+        return {
+            "userId": self.userId,
+            "query": self.query,
+            "createdAt": self.createdAt,
+            "results": self.results,
+        }
+
+
+def _ensure_worker() -> asyncio.Queue:
+    global _queue, _worker_task
+    if _queue is None:
+        _queue = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
+    if _worker_task is None or _worker_task.done():
+        _worker_task = asyncio.get_running_loop().create_task(_drain_queue())
+    return _queue
+
+
+def start_worker() -> None:
+    """
+    Starts the flush worker eagerly. Called from the server lifespan so the
+    first search of the process does not pay for task creation.
+    """
+    _ensure_worker()
+
+
+async def stop_worker() -> None:
+    """
+    Cancels the flush worker and writes out anything still queued. Called from
+    the server lifespan on shutdown so buffered entries are not lost.
+    """
+    global _worker_task
+    if _worker_task is not None:
+        _worker_task.cancel()
+        try:
+            await _worker_task
+        except asyncio.CancelledError:
+            pass
+        _worker_task = None
+    if _queue is None or _queue.empty():
+        return
+    remainder = []
+    while not _queue.empty():
+        remainder.append(_queue.get_nowait())
+    try:
+        await _Search.prisma().create_many(
+            data=[entry.to_record() for entry in remainder]
+        )
+    except Exception:
+        logger.exception("Failed to flush %d search log entries", len(remainder))
+
+
+async def _drain_queue() -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _queue.get()]
+        deadline = loop.time() + _FLUSH_INTERVAL
+        while len(batch) < _BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        try:
+            await _Search.prisma().create_many(
+                data=[entry.to_record() for entry in batch]
+            )
+        except Exception:
+            logger.exception("Failed to flush %d search log entries", len(batch))
+
 
 class SearchLogResponse(BaseModel):
     """
@@ -21,6 +122,9 @@ async def logSearchQuery(
     """
     Logs each user's search query for analysis and improvement of the search engine. It captures detailed information about the search query, including the search terms, filters applied, and timestamp of the search. This data is essential for understanding user behavior and enhancing search functionality.
 
+    The entry is queued for a background worker that bulk-inserts batches via
+    create_many, so the caller returns without waiting on the database.
+
     Args:
         search_query (str): The main search terms entered by the user.
         filters (Dict[str, str]): Any filters applied during the search, such as date ranges or categories.
@@ -30,17 +134,18 @@ async def logSearchQuery(
     Returns:
         SearchLogResponse: Confirms the logging of the user's search query along with any additional relevant information.
     """
+    entry = _SearchLogEntry(
+        userId=user_id,
+        query=search_query,
+        createdAt=timestamp,
+        results={"filters": filters},
+    )
     try:
-        await prisma.models.Search.prisma().create(
-            data={
-                "userId": user_id,
-                "query": search_query,
-                "createdAt": timestamp,
-                "results": {"filters": filters},
-            }
-        )
+        _ensure_worker().put_nowait(entry)
+    except asyncio.QueueFull:
         return SearchLogResponse(
-            success=True, message="Search has been logged successfully."
+            success=False, message="Search log queue is full; entry dropped."
         )
-    except Exception as e:
-        return SearchLogResponse(success=False, message=str(e))
+    return SearchLogResponse(
+        success=True, message="Search has been queued for logging."
+    )
@@ -1,7 +1,10 @@
 import prisma
 import prisma.models
+from fastapi import HTTPException
 from pydantic import BaseModel
 
+_Backup = prisma.models.Backup
+
 
 class RecoveryResponse(BaseModel):
     """
@@ -22,9 +25,9 @@ async def restoreData(backupId: str) -> RecoveryResponse:
     Returns:
         RecoveryResponse: Provides the response details after initiating a recovery operation. It includes the status of the operation and any relevant logs or error messages.
     """
-    backup = await prisma.models.Backup.prisma().find_unique(where={"id": backupId})
+    backup = await _Backup.prisma().find_unique(where={"id": backupId})
     if not backup:
-        return RecoveryResponse(status="failed", details="Backup ID not found")
+        raise HTTPException(status_code=404, detail="Backup not found")
     return RecoveryResponse(
         status="success", details=f"Data restored from backup at {backup.dataPath}"
     )
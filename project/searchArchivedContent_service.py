@@ -1,10 +1,34 @@
+import asyncio
+import base64
+import binascii
 from datetime import datetime
 from typing import List, Optional
 
+import msgspec
 import prisma
 import prisma.models
+from fastapi import HTTPException
 from pydantic import BaseModel
 
+from project.serialization import MsgspecJSONResponse
+
+_CrawledData = prisma.models.CrawledData
+
+
+def _encode_cursor(created_at: datetime, record_id: str) -> str:
+    """Packs the keyset position into an opaque token for the client."""
+    raw = f"{created_at.isoformat()}|{record_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> str:
+    """Unpacks a cursor token back into the id of the last-seen row."""
+    try:
+        _, record_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return record_id
+
 
 class SearchResult(BaseModel):
     """
@@ -24,9 +48,36 @@ class SearchResponseModel(BaseModel):
     """
 
     results: List[SearchResult]
-    total_results: int
     current_page: int
-    total_pages: int
+    total_results: Optional[int] = None
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+class _SearchResultRow(msgspec.Struct):
+    """msgspec twin of SearchResult used on the serialization fast path."""
+
+    id: str
+    title: str
+    summary: str
+    date: str
+    content_type: str
+
+
+class _SearchResponseBody(msgspec.Struct):
+    """msgspec twin of SearchResponseModel used on the serialization fast path."""
+
+    results: List[_SearchResultRow]
+    current_page: int
+    total_results: Optional[int] = None
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+# Queries currently being answered, keyed by the full argument tuple. When
+# identical searches land concurrently (dashboard refreshes, double-clicks),
+# the followers await the leader's task instead of re-running the query.
+_inflight: dict = {}
 
 
 async def searchArchivedContent(
@@ -36,7 +87,8 @@ async def searchArchivedContent(
     content_type: Optional[str],
     page: Optional[int],
     page_size: Optional[int],
-) -> SearchResponseModel:
+    cursor: Optional[str] = None,
+) -> MsgspecJSONResponse:
     """
     Allows users to search the archived content using various criteria such as keywords, date ranges, and content types.
     This route fetches data using the Data Storage Module. The response includes a paginated list of search results tailored to the query parameters provided by the user.
@@ -46,50 +98,101 @@ async def searchArchivedContent(
         start_date (Optional[str]): The starting date of the date range for which to include the search results.
         end_date (Optional[str]): The end date of the date range for which to include the search results.
         content_type (Optional[str]): The types of content to include in the search, such as text, images, etc.
-        page (Optional[int]): The pagination index for the search results.
+        page (Optional[int]): The pagination index for the search results. Deprecated in favour of cursor.
         page_size (Optional[int]): The number of results per page.
+        cursor (Optional[str]): Opaque keyset cursor returned as next_cursor by a previous call. Cursor mode skips the expensive count query and keeps deep pages cheap.
 
     Returns:
-        SearchResponseModel: Model that defines the structure of the paginated search results returned from the server.
+        MsgspecJSONResponse: The SearchResponseModel shape, encoded with msgspec
+        to keep large result pages off the pydantic serialization path.
     """
+    key = (keywords, start_date, end_date, content_type, page, page_size, cursor)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _searchArchivedContent(
+                keywords, start_date, end_date, content_type, page, page_size, cursor
+            )
+        )
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await task
+
+
+async def _searchArchivedContent(
+    keywords: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    content_type: Optional[str],
+    page: Optional[int],
+    page_size: Optional[int],
+    cursor: Optional[str],
+) -> MsgspecJSONResponse:
+    """Runs one search query; callers are coalesced by searchArchivedContent."""
     page = page or 1
     page_size = page_size or 10
     where_conditions = {}
     if keywords:
         where_conditions["ArchivedResource"] = {"resourceUrl": {"contains": keywords}}
-    if start_date and end_date:
-        where_conditions["createdAt"] = {
-            "gte": datetime.strptime(start_date, "%Y-%m-%d"),
-            "lte": datetime.strptime(end_date, "%Y-%m-%d"),
-        }
+    date_bounds = {}
+    try:
+        if start_date:
+            date_bounds["gte"] = datetime.fromisoformat(start_date)
+        if end_date:
+            date_bounds["lte"] = datetime.fromisoformat(end_date)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Dates must be ISO 8601 formatted")
+    if date_bounds:
+        where_conditions["createdAt"] = date_bounds
     if content_type:
         where_conditions["compressionType"] = {"equals": content_type}
-    crawled_data = await prisma.models.CrawledData.prisma().find_many(
-        skip=(page - 1) * page_size,
-        take=page_size,
-        where=where_conditions,
-        include={"ArchivedResource": True},
-    )
+    if cursor is not None:
+        crawled_data = await _CrawledData.prisma().find_many(
+            cursor={"id": _decode_cursor(cursor)},
+            skip=1,
+            take=page_size,
+            where=where_conditions,
+            order=[{"createdAt": "desc"}, {"id": "desc"}],
+            include={"ArchivedResource": True},
+        )
+        total_results = None
+    else:
+        crawled_data, total_results = await asyncio.gather(
+            _CrawledData.prisma().find_many(
+                skip=(page - 1) * page_size,
+                take=page_size,
+                where=where_conditions,
+                include={"ArchivedResource": True},
+            ),
+            _CrawledData.prisma().count(where=where_conditions),
+        )
     search_results = []
     for data in crawled_data:
         arch_res = data.ArchivedResource
         search_results.append(
-            SearchResult(
+            _SearchResultRow(
                 id=arch_res.id,
                 title=arch_res.resourceUrl,
                 summary=arch_res.data.get("summary", "No summary available"),
                 date=arch_res.createdAt.strftime("%Y-%m-%d"),
                 content_type=data.compressionType or "unknown",
             )
-        )  # TODO(autogpt): Cannot access member "get" for type "Json"
-    #     Member "get" is unknown. reportAttributeAccessIssue
-    total_results = await prisma.models.CrawledData.prisma().count(
-        where=where_conditions
+        )
+    total_pages = (
+        (total_results + page_size - 1) // page_size
+        if total_results is not None
+        else None
     )
-    total_pages = (total_results + page_size - 1) // page_size
-    return SearchResponseModel(
-        results=search_results,
-        total_results=total_results,
-        current_page=page,
-        total_pages=total_pages,
+    next_cursor = None
+    if len(crawled_data) == page_size:
+        last = crawled_data[-1]
+        next_cursor = _encode_cursor(last.createdAt, last.id)
+    return MsgspecJSONResponse(
+        _SearchResponseBody(
+            results=search_results,
+            current_page=page,
+            total_results=total_results,
+            total_pages=total_pages,
+            next_cursor=next_cursor,
+        )
     )
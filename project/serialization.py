@@ -0,0 +1,38 @@
+from typing import Any
+
+import msgspec
+import orjson
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Last-resort fallback for the rare types orjson has no native path for."""
+    return str(obj)
+
+
+class FastJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse with the option flags resolved once at class scope.
+
+    Keeps the encode entirely in C for the types the routes actually emit
+    (dicts, lists, str, int, datetime) and normalizes datetimes to Z-suffixed
+    UTC instead of +00:00 offsets.
+    """
+
+    _OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=self._OPTS, default=_orjson_default)
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """
+    JSONResponse that encodes msgspec Structs directly.
+
+    Large list endpoints build msgspec.Struct rows instead of pydantic models
+    and return them through this class, bypassing the pydantic serialization
+    pass entirely.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return msgspec.json.encode(content)
@@ -1,10 +1,12 @@
+import asyncio
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Optional
+
+import anyio.to_thread
 
-import prisma
-import prisma.enums
 import project.compressData_service
 import project.createBackup_service
 import project.createUser_service
@@ -32,666 +34,298 @@ import project.updateCompressionSettings_service
 import project.updateCrawlingConfig_service
 import project.updateUser_service
 import project.updateWebData_service
-from fastapi import FastAPI
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import Response
+from fastapi import FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from prisma import Prisma
 
-logger = logging.getLogger(__name__)
-
-db_client = Prisma(auto_register=True)
-
-
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    await db_client.connect()
-    yield
-    await db_client.disconnect()
-
-
-app = FastAPI(title="arechgie", lifespan=lifespan, description="archive the internet")
-
-
-@app.put(
-    "/compress/settings",
-    response_model=project.updateCompressionSettings_service.CompressionSettingsUpdateResponse,
-)
-async def api_put_updateCompressionSettings(
-    algorithm: str, level: int, optimize_for: str
-) -> project.updateCompressionSettings_service.CompressionSettingsUpdateResponse | Response:
-    """
-    Updates the compression settings based on input parameters. This route is crucial for tailoring the compression process to specific needs, such as optimizing for speed or compression ratio. The expectations are to provide the new settings in the request, and the response confirms the successful update.
-    """
-    try:
-        res = await project.updateCompressionSettings_service.updateCompressionSettings(
-            algorithm, level, optimize_for
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.post(
-    "/search/logs", response_model=project.logSearchQuery_service.SearchLogResponse
-)
-async def api_post_logSearchQuery(
-    search_query: str, filters: Dict[str, str], user_id: str, timestamp: datetime
-) -> project.logSearchQuery_service.SearchLogResponse | Response:
-    """
-    Logs each user's search query for analysis and improvement of the search engine. It captures detailed information about the search query, including the search terms, filters applied, and timestamp of the search. This data is essential for understanding user behavior and enhancing search functionality.
-    """
-    try:
-        res = await project.logSearchQuery_service.logSearchQuery(
-            search_query, filters, user_id, timestamp
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.delete(
-    "/users/{userId}", response_model=project.deleteUser_service.DeleteUserResponse
-)
-async def api_delete_deleteUser(
-    userId: str,
-) -> project.deleteUser_service.DeleteUserResponse | Response:
-    """
-    Removes a user from the system using the specified userId. A successful operation will confirm the user's removal. The API Access Module handles this to maintain data integrity and log the action for security compliance.
-    """
-    try:
-        res = await project.deleteUser_service.deleteUser(userId)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.put(
-    "/users/{userId}", response_model=project.updateUser_service.UpdateUserResponse
-)
-async def api_put_updateUser(
-    userId: str, email: str, password: str, role: prisma.enums.Role
-) -> project.updateUser_service.UpdateUserResponse | Response:
-    """
-    Updates details for a specific user. It securely updates user data in the Data Storage Module based on the provided userId and input data. Returns the updated user information upon successful update.
-    """
-    try:
-        res = await project.updateUser_service.updateUser(userId, email, password, role)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.get("/backups", response_model=project.listBackups_service.BackupListingResponse)
-async def api_get_listBackups(
-    request: project.listBackups_service.GetBackupsRequest,
-) -> project.listBackups_service.BackupListingResponse | Response:
-    """
-    Retrieves a list of all backup records. Each record provides the backup ID, date, and status. This allows system administrators and backup operators to monitor the backup states.
-    """
-    try:
-        res = await project.listBackups_service.listBackups(request)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.get("/users", response_model=project.listUsers_service.GetUsersResponse)
-async def api_get_listUsers(
-    page: Optional[int], limit: Optional[int], sort: Optional[str]
-) -> project.listUsers_service.GetUsersResponse | Response:
-    """
-    Retrieves a list of all users. User data is fetched from the Data Storage Module, and this route is commonly used to manage users or retrieve a complete user listing. Response includes an array of user data.
-    """
-    try:
-        res = await project.listUsers_service.listUsers(page, limit, sort)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.get(
-    "/search", response_model=project.searchArchivedContent_service.SearchResponseModel
-)
-async def api_get_searchArchivedContent(
-    keywords: Optional[str],
-    start_date: Optional[str],
-    end_date: Optional[str],
-    content_type: Optional[str],
-    page: Optional[int],
-    page_size: Optional[int],
-) -> project.searchArchivedContent_service.SearchResponseModel | Response:
-    """
-    Allows users to search the archived content using various criteria such as keywords, date ranges, and content types. This route fetches data using the Data Storage Module. The response includes a paginated list of search results tailored to the query parameters provided by the user.
-    """
-    try:
-        res = await project.searchArchivedContent_service.searchArchivedContent(
-            keywords, start_date, end_date, content_type, page, page_size
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.post("/compress", response_model=project.compressData_service.CompressDataResponse)
-async def api_post_compressData(
-    data: str, compressionAlgorithm: Optional[str]
-) -> project.compressData_service.CompressDataResponse | Response:
-    """
-    Accepts raw data from the Crawling Module, compresses it using specified algorithms, and forwards the compressed data to the Data Storage Module. The response includes a confirmation of the data receipt and a summary of the compression results, such as the compression ratio achieved.
-    """
-    try:
-        res = project.compressData_service.compressData(data, compressionAlgorithm)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.get(
-    "/web-data/{dataId}",
-    response_model=project.getWebData_service.GetWebDataByIdResponse,
-)
-async def api_get_getWebData(
-    dataId: str,
-) -> project.getWebData_service.GetWebDataByIdResponse | Response:
-    """
-    Retrieves specific web data by its ID. Used to fetch data for the Search Engine Module or for administrative purposes. Returns JSON object of the web data if found or a not found error if no such data exists.
-    """
-    try:
-        res = await project.getWebData_service.getWebData(dataId)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.delete(
-    "/backups/{backupId}",
-    response_model=project.deleteBackup_service.DeleteBackupResponse,
-)
-async def api_delete_deleteBackup(
-    backupId: str,
-) -> project.deleteBackup_service.DeleteBackupResponse | Response:
-    """
-    Deletes a specific backup by its backup ID, removing it from the storage. Used to manage storage and delete old or unnecessary backups, ensuring efficient use of resources.
-    """
-    try:
-        res = await project.deleteBackup_service.deleteBackup(backupId)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.delete(
-    "/web-data/{dataId}",
-    response_model=project.deleteWebData_service.DeleteWebDataResponse,
-)
-async def api_delete_deleteWebData(
-    dataId: str, role: prisma.enums.Role
-) -> project.deleteWebData_service.DeleteWebDataResponse | Response:
-    """
-    Deletes specific web data by its ID. Necessary for maintaining data relevance and storage management. A success response is returned if the operation is successful.
-    """
-    try:
-        res = await project.deleteWebData_service.deleteWebData(dataId, role)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+from project.serialization import FastJSONResponse
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-@app.get(
-    "/backups/{backupId}",
-    response_model=project.getBackupDetails_service.BackupDetailsResponse,
-)
-async def api_get_getBackupDetails(
-    backupId: str,
-) -> project.getBackupDetails_service.BackupDetailsResponse | Response:
-    """
-    Fetches the details of a specific backup using the backup ID, including the data size, backup date, and any errors encountered. Essential for detailed diagnostics and backup verification.
-    """
-    try:
-        res = await project.getBackupDetails_service.getBackupDetails(backupId)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.post("/backups", response_model=project.createBackup_service.CreateBackupResponse)
-async def api_post_createBackup(
-    data_identifier: str, compression_type: Optional[str]
-) -> project.createBackup_service.CreateBackupResponse | Response:
-    """
-    Creates a backup of the data. This route triggers the backup process in the Data Storage Module, storing the backup data possibly in a separate storage solution. The API should return a success status and a backup ID.
-    """
-    try:
-        res = await project.createBackup_service.createBackup(
-            data_identifier, compression_type
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.get(
-    "/compress/settings",
-    response_model=project.getCompressionSettings_service.CompressionSettingsResponse,
-)
-async def api_get_getCompressionSettings(
-    request: project.getCompressionSettings_service.GetCompressionSettingsRequest,
-) -> project.getCompressionSettings_service.CompressionSettingsResponse | Response:
-    """
-    Retrieves the current compression settings and algorithms in use. This information helps in understanding the compression process and adjusting parameters if necessary. The response includes details such as algorithm names, compression levels, and expected efficiencies.
-    """
-    try:
-        res = await project.getCompressionSettings_service.getCompressionSettings(
-            request
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.post("/recoveries", response_model=project.restoreData_service.RecoveryResponse)
-async def api_post_restoreData(
-    backupId: str,
-) -> project.restoreData_service.RecoveryResponse | Response:
-    """
-    Initiates a data recovery operation using a specified backup ID. The data restore updates the current state of the Data Storage Module to match that of the backup. This route returns a success status and details of the restore process.
-    """
-    try:
-        res = await project.restoreData_service.restoreData(backupId)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.put(
-    "/web-data/{dataId}",
-    response_model=project.updateWebData_service.UpdateWebDataResponse,
-)
-async def api_put_updateWebData(
-    dataId: str, new_content: Dict[str, Any], compressionType: Optional[str]
-) -> project.updateWebData_service.UpdateWebDataResponse | Response:
-    """
-    Updates existing web data by its ID with new content received from the Crawling Module. Validates changes and confirms update success. Returns the updated data object.
-    """
-    try:
-        res = await project.updateWebData_service.updateWebData(
-            dataId, new_content, compressionType
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.post(
-    "/crawling/stop", response_model=project.stopCrawling_service.CrawlingStopResponse
-)
-async def api_post_stopCrawling(
-    crawlingSessionId: Optional[str],
-) -> project.stopCrawling_service.CrawlingStopResponse | Response:
-    """
-    Stops the currently running crawling process. Should confirm whether the stop was successful and the state of the last crawl.
-    """
-    try:
-        res = await project.stopCrawling_service.stopCrawling(crawlingSessionId)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.post(
-    "/web-data", response_model=project.createWebData_service.StoreWebDataResponse
-)
-async def api_post_createWebData(
-    userId: str, data: Dict[str, Any], compressionType: Optional[str]
-) -> project.createWebData_service.StoreWebDataResponse | Response:
-    """
-    Stores web data sent from the Crawling Module. Expects JSON payload representing web data. Ensures data integrity and consistency before storage. Accessible only by the System Administrator and Data Manager.
-    """
-    try:
-        res = await project.createWebData_service.createWebData(
-            userId, data, compressionType
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
-
-@app.get(
-    "/users/{userId}", response_model=project.getUserDetails_service.UserDetailsResponse
-)
-async def api_get_getUserDetails(
-    userId: str,
-) -> project.getUserDetails_service.UserDetailsResponse | Response:
-    """
-    Fetches detailed information of a user identified by userId. This includes user contact information, roles, and activity logs. Makes use of the API Access Module to retrieve user data securely. The result is a detailed user profile.
-    """
-    try:
-        res = await project.getUserDetails_service.getUserDetails(userId)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+logger = logging.getLogger(__name__)
 
+# Every route is thin I/O to Prisma, so throughput is loop-bound; run on
+# uvloop's libuv-backed loop where it is available (Linux/macOS).
+if uvloop is not None:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
-@app.post("/users", response_model=project.createUser_service.CreateUserResponse)
-async def api_post_createUser(
-    username: str, email: str, role: prisma.enums.Role
-) -> project.createUser_service.CreateUserResponse | Response:
-    """
-    This endpoint creates a new user within the system. It expects details like username, email, and roles in the body of the request. Upon successful creation, it returns the user ID along with a success message. This interaction uses the API Access Module for user data validation and storage.
+def _build_datasource_url() -> Optional[str]:
     """
-    try:
-        res = await project.createUser_service.createUser(username, email, role)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    Returns DATABASE_URL with explicit pool sizing appended, or None when no
+    URL is configured (Prisma then falls back to the schema datasource).
 
-
-@app.get(
-    "/crawling/data",
-    response_model=project.fetchCrawledData_service.FetchCrawledDataResponse,
-)
-async def api_get_fetchCrawledData(
-    request: project.fetchCrawledData_service.FetchCrawledDataRequest,
-) -> project.fetchCrawledData_service.FetchCrawledDataResponse | Response:
+    The query engine's default pool is easily starved once every route runs
+    parallel queries; 2*cpu+1 connections with a short pool_timeout keeps
+    waiters from piling up silently. statement_cache_size keeps prepared
+    plans server-side, since the whole app runs the same handful of
+    parameterized statements.
     """
-    Retrieves crawled data stored by the module. It interacts with the Data Storage Module for fetching the data. Response should include the fetched data.
-    """
-    try:
-        res = await project.fetchCrawledData_service.fetchCrawledData(request)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
+    url = os.environ.get("DATABASE_URL")
+    if not url:
+        return None
+    limit = os.environ.get("PRISMA_CONNECTION_LIMIT")
+    if not limit:
+        limit = str(2 * (os.cpu_count() or 1) + 1)
+    separator = "&" if "?" in url else "?"
+    return (
+        f"{url}{separator}connection_limit={limit}"
+        "&pool_timeout=2&statement_cache_size=500"
+    )
 
-@app.patch(
-    "/crawling/config",
-    response_model=project.updateCrawlingConfig_service.CrawlingConfigUpdateResponse,
-)
-async def api_patch_updateCrawlingConfig(
-    crawl_depth: Optional[int],
-    pause_duration: Optional[float],
-    target_domains: Optional[List[str]],
-) -> project.updateCrawlingConfig_service.CrawlingConfigUpdateResponse | Response:
-    """
-    Updates configurations used for the crawling process, such as crawl depth, pause duration, and target domains. Response confirms the application of new settings.
-    """
-    try:
-        res = await project.updateCrawlingConfig_service.updateCrawlingConfig(
-            crawl_depth, pause_duration, target_domains
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
 
+_datasource_url = _build_datasource_url()
 
-@app.post(
-    "/crawling/start",
-    response_model=project.startCrawling_service.CrawlingInitiationResponse,
+db_client = Prisma(
+    auto_register=True,
+    datasource={"url": _datasource_url} if _datasource_url else None,
 )
-async def api_post_startCrawling(
-    urls: List[str], userId: str, depth: Optional[int], delay: Optional[int]
-) -> project.startCrawling_service.CrawlingInitiationResponse | Response:
-    """
-    Initiates the crawling process. It schedules tasks, fetches URLs, and begins extraction and parsing. This uses the Data Compression Module for preprocessing data. Successful response should indicate crawling initiation status.
-    """
-    try:
-        res = await project.startCrawling_service.startCrawling(
-            urls, userId, depth, delay
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
 
 
-@app.get(
-    "/compress/files",
-    response_model=project.listCompressedFiles_service.GetCompressedFilesResponse,
-)
-async def api_get_listCompressedFiles(
-    request: project.listCompressedFiles_service.GetCompressedFilesRequest,
-) -> project.listCompressedFiles_service.GetCompressedFilesResponse | Response:
-    """
-    Lists all the files that have been compressed. It provides details such as file identifiers, original sizes, compressed sizes, and compression ratios. This is useful for monitoring and auditing purposes. The response includes a list of files along with the mentioned data.
-    """
-    try:
-        res = await project.listCompressedFiles_service.listCompressedFiles(request)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+# Thread capacity for offloaded sync work. The compression handlers push
+# CPU-bound work through asyncio.to_thread, and the stock pools (40 anyio
+# tokens, min(32, cpu+4) executor threads) are easy to exhaust under bursts.
+_THREAD_POOL_SIZE = max(64, (os.cpu_count() or 1) * 8)
 
 
-@app.get("/web-data", response_model=project.getAllWebData_service.GetWebDataOutput)
-async def api_get_getAllWebData(
-    page: int, pageSize: int
-) -> project.getAllWebData_service.GetWebDataOutput | Response:
-    """
-    Retrieves all stored web data in a paginated response. Primarily used for oversight and backup purposes. Returns a list of web data entries.
-    """
-    try:
-        res = await project.getAllWebData_service.getAllWebData(page, pageSize)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = _THREAD_POOL_SIZE
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=_THREAD_POOL_SIZE)
+    )
+    await db_client.connect()
+    # Warm the query-engine pool so the first real request does not pay the
+    # connection-establishment tax (connect() alone leaves the pool lazy).
+    await db_client.query_raw("SELECT 1")
+    project.logSearchQuery_service.start_worker()
+    yield
+    await project.logSearchQuery_service.stop_worker()
+    await db_client.disconnect()
 
 
-@app.get(
-    "/crawling/status",
-    response_model=project.getCrawlingStatus_service.GetCrawlingStatusResponse,
+app = FastAPI(
+    title="arechgie",
+    lifespan=lifespan,
+    description="archive the internet",
+    default_response_class=FastJSONResponse,
 )
-async def api_get_getCrawlingStatus(
-    request: project.getCrawlingStatus_service.GetCrawlingStatusRequest,
-) -> project.getCrawlingStatus_service.GetCrawlingStatusResponse | Response:
-    """
-    Provides current status of the crawling process, including the number of pages processed, current URLs being crawled, and any errors. Expected response includes status details.
-    """
-    try:
-        res = await project.getCrawlingStatus_service.getCrawlingStatus(request)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
-
 
-@app.get(
-    "/search/metadata",
-    response_model=project.fetchSearchMetadata_service.GetSearchMetadataResponse,
-)
-async def api_get_fetchSearchMetadata(
-    request: project.fetchSearchMetadata_service.GetSearchMetadataRequest,
-) -> project.fetchSearchMetadata_service.GetSearchMetadataResponse | Response:
-    """
-    Provides metadata necessary for front-end components to render search interfaces effectively, such as available filters and search criteria options. This endpoint directly interacts with the Data Storage Module to ensure up-to-date metadata is always provided. It helps in providing dynamic search options based on the data available.
-    """
-    try:
-        res = await project.fetchSearchMetadata_service.fetchSearchMetadata(request)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+# The listing endpoints return large JSON arrays; compress anything past 1KiB
+# at a moderate level so bandwidth wins don't turn into CPU losses.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+@app.exception_handler(Exception)
+async def handle_unexpected_error(request: Request, exc: Exception) -> ORJSONResponse:
+    """
+    Single failure path for every route, replacing the per-handler try/except
+    blocks so the success path stays branchless.
+    """
+    logger.exception("Error processing request")
+    return ORJSONResponse({"error": str(exc)}, status_code=500)
+
+
+@app.exception_handler(RequestValidationError)
+async def handle_validation_error(
+    request: Request, exc: RequestValidationError
+) -> ORJSONResponse:
+    """
+    Mirrors FastAPI's stock 422 response but serializes it with orjson
+    directly instead of walking the payload through jsonable_encoder. Only
+    the ctx values need coercion; everything else pydantic emits is already
+    JSON-native.
+    """
+    detail = [
+        {**err, "ctx": {k: str(v) for k, v in err["ctx"].items()}}
+        if "ctx" in err
+        else err
+        for err in exc.errors()
+    ]
+    return ORJSONResponse({"detail": detail}, status_code=422)
+
+
+# One registration loop instead of 27 near-identical wrapper functions: the
+# service coroutines are the endpoints themselves, FastAPI introspects each
+# signature once at startup, and requests skip the extra Python frame the
+# wrappers used to add. Each entry is (method, path, response model, endpoint).
+ROUTES = [
+    (
+        "PUT",
+        "/compress/settings",
+        project.updateCompressionSettings_service.CompressionSettingsUpdateResponse,
+        project.updateCompressionSettings_service.updateCompressionSettings,
+    ),
+    (
+        "POST",
+        "/search/logs",
+        project.logSearchQuery_service.SearchLogResponse,
+        project.logSearchQuery_service.logSearchQuery,
+    ),
+    (
+        "DELETE",
+        "/users/{userId}",
+        project.deleteUser_service.DeleteUserResponse,
+        project.deleteUser_service.deleteUser,
+    ),
+    (
+        "PUT",
+        "/users/{userId}",
+        project.updateUser_service.UpdateUserResponse,
+        project.updateUser_service.updateUser,
+    ),
+    (
+        "GET",
+        "/backups",
+        project.listBackups_service.BackupListingResponse,
+        project.listBackups_service.listBackups,
+    ),
+    (
+        "GET",
+        "/users",
+        project.listUsers_service.GetUsersResponse,
+        project.listUsers_service.listUsers,
+    ),
+    (
+        "GET",
+        "/search",
+        project.searchArchivedContent_service.SearchResponseModel,
+        project.searchArchivedContent_service.searchArchivedContent,
+    ),
+    (
+        "POST",
+        "/compress",
+        project.compressData_service.CompressDataResponse,
+        project.compressData_service.compressData,
+    ),
+    (
+        "GET",
+        "/web-data/{dataId}",
+        project.getWebData_service.GetWebDataByIdResponse,
+        project.getWebData_service.getWebData,
+    ),
+    (
+        "DELETE",
+        "/backups/{backupId}",
+        project.deleteBackup_service.DeleteBackupResponse,
+        project.deleteBackup_service.deleteBackup,
+    ),
+    (
+        "DELETE",
+        "/web-data/{dataId}",
+        project.deleteWebData_service.DeleteWebDataResponse,
+        project.deleteWebData_service.deleteWebData,
+    ),
+    (
+        "GET",
+        "/backups/{backupId}",
+        project.getBackupDetails_service.BackupDetailsResponse,
+        project.getBackupDetails_service.getBackupDetails,
+    ),
+    (
+        "POST",
+        "/backups",
+        project.createBackup_service.CreateBackupResponse,
+        project.createBackup_service.createBackup,
+    ),
+    (
+        "GET",
+        "/compress/settings",
+        project.getCompressionSettings_service.CompressionSettingsResponse,
+        project.getCompressionSettings_service.getCompressionSettings,
+    ),
+    (
+        "POST",
+        "/recoveries",
+        project.restoreData_service.RecoveryResponse,
+        project.restoreData_service.restoreData,
+    ),
+    (
+        "PUT",
+        "/web-data/{dataId}",
+        project.updateWebData_service.UpdateWebDataResponse,
+        project.updateWebData_service.updateWebData,
+    ),
+    (
+        "POST",
+        "/crawling/stop",
+        project.stopCrawling_service.CrawlingStopResponse,
+        project.stopCrawling_service.stopCrawling,
+    ),
+    (
+        "POST",
+        "/web-data",
+        project.createWebData_service.StoreWebDataResponse,
+        project.createWebData_service.createWebData,
+    ),
+    (
+        "GET",
+        "/users/{userId}",
+        project.getUserDetails_service.UserDetailsResponse,
+        project.getUserDetails_service.getUserDetails,
+    ),
+    (
+        "POST",
+        "/users",
+        project.createUser_service.CreateUserResponse,
+        project.createUser_service.createUser,
+    ),
+    (
+        "GET",
+        "/crawling/data",
+        project.fetchCrawledData_service.FetchCrawledDataResponse,
+        project.fetchCrawledData_service.fetchCrawledData,
+    ),
+    (
+        "PATCH",
+        "/crawling/config",
+        project.updateCrawlingConfig_service.CrawlingConfigUpdateResponse,
+        project.updateCrawlingConfig_service.updateCrawlingConfig,
+    ),
+    (
+        "POST",
+        "/crawling/start",
+        project.startCrawling_service.CrawlingInitiationResponse,
+        project.startCrawling_service.startCrawling,
+    ),
+    (
+        "GET",
+        "/compress/files",
+        project.listCompressedFiles_service.GetCompressedFilesResponse,
+        project.listCompressedFiles_service.listCompressedFiles,
+    ),
+    (
+        "GET",
+        "/web-data",
+        project.getAllWebData_service.GetWebDataOutput,
+        project.getAllWebData_service.getAllWebData,
+    ),
+    (
+        "GET",
+        "/crawling/status",
+        project.getCrawlingStatus_service.GetCrawlingStatusResponse,
+        project.getCrawlingStatus_service.getCrawlingStatus,
+    ),
+    (
+        "GET",
+        "/search/metadata",
+        project.fetchSearchMetadata_service.GetSearchMetadataResponse,
+        project.fetchSearchMetadata_service.fetchSearchMetadata,
+    ),
+]
+
+# response_model=None keeps FastAPI from revalidating the already-built model
+# on every request; the documented schema is preserved for OpenAPI through the
+# responses mapping instead.
+for _method, _path, _response_model, _endpoint in ROUTES:
+    app.add_api_route(
+        _path,
+        _endpoint,
+        methods=[_method],
+        response_model=None,
+        responses={200: {"model": _response_model}},
+    )
@@ -2,9 +2,22 @@ from typing import List, Optional
 
 import prisma
 import prisma.enums
-import prisma.models
 from pydantic import BaseModel
 
+import project.getCrawlingStatus_service
+
+# Roles allowed to start a crawl. The SQL IN-list is derived from this set at
+# import so the permission constant and the insert query cannot drift apart.
+_ALLOWED_ROLES = frozenset(
+    {prisma.enums.Role.USER, prisma.enums.Role.SYSTEM_ADMINISTRATOR}
+)
+_START_SESSION_SQL = (
+    'INSERT INTO "CrawlingSession"("userId", "status", "logsPath") '
+    "SELECT id, 'active', '' FROM \"User\" "
+    "WHERE id = $1 AND role::text IN ({}) "
+    "RETURNING id"
+).format(", ".join(f"'{role.value}'" for role in sorted(_ALLOWED_ROLES)))
+
 
 class CrawlingInitiationResponse(BaseModel):
     """
@@ -31,24 +44,23 @@ async def startCrawling(
     Returns:
         CrawlingInitiationResponse: Provides details about the initiated crawling task, including an indication if the task was successfully scheduled and an ID to track it.
     """
-    user = await prisma.models.User.prisma().find_unique(where={"id": userId})
-    if user is None:
-        return CrawlingInitiationResponse(success=False, message="User not found")
-    allowed_roles = [prisma.enums.Role.USER, prisma.enums.Role.SYSTEM_ADMINISTRATOR]
-    if user.role not in allowed_roles:
-        return CrawlingInitiationResponse(
-            success=False, message="Insufficient permissions"
-        )
-    session = await prisma.models.CrawlingSession.prisma().create(
-        data={"userId": userId, "status": "active"}
-    )
-    if session:
+    # Permission check and session insert in one atomic statement: the row is
+    # only created when the user exists with an allowed role, so the common
+    # case costs a single round trip and there is no check-then-create race.
+    rows = await prisma.get_client().query_raw(_START_SESSION_SQL, userId)
+    if rows:
+        project.getCrawlingStatus_service.invalidate_cache()
         return CrawlingInitiationResponse(
             success=True,
             message="Crawling initiated successfully",
-            sessionId=session.id,
-        )
-    else:
-        return CrawlingInitiationResponse(
-            success=False, message="Failed to initiate crawling session"
+            sessionId=rows[0]["id"],
         )
+    # Error path only: a one-column projection is enough to tell a missing
+    # user apart from one whose role is not allowed. prisma-client-py has no
+    # select argument on find_unique, so project in SQL instead.
+    user_rows = await prisma.get_client().query_raw(
+        'SELECT 1 FROM "User" WHERE id = $1', userId
+    )
+    if not user_rows:
+        return CrawlingInitiationResponse(success=False, message="User not found")
+    return CrawlingInitiationResponse(success=False, message="Insufficient permissions")
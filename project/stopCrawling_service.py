@@ -1,10 +1,14 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 import prisma
 import prisma.models
 from pydantic import BaseModel
 
+import project.getCrawlingStatus_service
+
+_CrawlingSession = prisma.models.CrawlingSession
+
 
 class CrawlingSessionDetails(BaseModel):
     """
@@ -35,30 +39,28 @@ async def stopCrawling(crawlingSessionId: Optional[str]) -> CrawlingStopResponse
     Returns:
         CrawlingStopResponse: Provides confirmation and details about stopping a crawling session, including the final state if the request was successful.
     """
-    if crawlingSessionId:
-        session = await prisma.models.CrawlingSession.prisma().find_unique(
-            where={"id": crawlingSessionId, "status": "active"}
-        )
-    else:
-        session = await prisma.models.CrawlingSession.prisma().find_first(
-            where={"status": "active"}, order={"startTime": "desc"}
-        )
-    if not session:
+    # One atomic update_many instead of find-then-update: status="active" in
+    # the filter makes the stop idempotent and race-free, and the returned
+    # count is all the branching needs, so a stop costs a single round trip.
+    end_time = datetime.now(timezone.utc)
+    count = await _CrawlingSession.prisma().update_many(
+        where={
+            "status": "active",
+            **({"id": crawlingSessionId} if crawlingSessionId else {}),
+        },
+        data={"status": "stopped", "endTime": end_time},
+    )
+    if count == 0:
         return CrawlingStopResponse(
             success=False, message="No active crawling session found."
         )
-    updated_session = await prisma.models.CrawlingSession.prisma().update(
-        where={"id": session.id}, data={"status": "stopped", "endTime": datetime.now()}
+    project.getCrawlingStatus_service.invalidate_cache()
+    # The details are known from the write itself; no re-fetch needed, and
+    # model_construct skips validating values this function just produced.
+    return CrawlingStopResponse.model_construct(
+        success=True,
+        message="Crawling session stopped successfully.",
+        crawlingSessionDetails=CrawlingSessionDetails.model_construct(
+            status="stopped", endTime=end_time
+        ),
     )
-    if updated_session:
-        return CrawlingStopResponse(
-            success=True,
-            message="Crawling session stopped successfully.",
-            crawlingSessionDetails=CrawlingSessionDetails(
-                status=updated_session.status, endTime=updated_session.endTime
-            ),
-        )
-    else:
-        return CrawlingStopResponse(
-            success=False, message="Failed to stop the crawling session."
-        )
@@ -1,7 +1,25 @@
+import logging
+
 import prisma
 import prisma.models
 from pydantic import BaseModel
 
+import project.getCompressionSettings_service
+from project.errors import ErrorCode
+
+logger = logging.getLogger(__name__)
+
+_Backup = prisma.models.Backup
+
+# Last algorithm written by this process; a resaved-but-unchanged settings
+# form (common from the UI) then skips the write entirely.
+_last_algo = None
+
+_MSG_TMPL = (
+    "Compression settings updated to use {algo} with level {lvl} "
+    "and optimized for {opt}."
+)
+
 
 class CompressionSettingsUpdateResponse(BaseModel):
     """
@@ -30,21 +48,32 @@ async def updateCompressionSettings(
     Returns:
         CompressionSettingsUpdateResponse: Response model confirming the updates made to the compression settings.
     """
+    global _last_algo
+    if algorithm == _last_algo:
+        return CompressionSettingsUpdateResponse.model_construct(
+            success=True,
+            message=f"Compression settings already use {algorithm}; nothing to update.",
+        )
     try:
-        backup_setting = await prisma.models.Backup.prisma().update(
+        backup_setting = await _Backup.prisma().update(
             where={"CompressionType": "DEFAULT"}, data={"CompressionType": algorithm}
         )
         if backup_setting:
-            response = CompressionSettingsUpdateResponse(
+            _last_algo = algorithm
+            project.getCompressionSettings_service.invalidate_cache()
+            response = CompressionSettingsUpdateResponse.model_construct(
                 success=True,
-                message=f"Compression settings updated to use {algorithm} with level {level} and optimized for {optimize_for}.",
+                message=_MSG_TMPL.format_map(
+                    {"algo": algorithm, "lvl": level, "opt": optimize_for}
+                ),
             )
         else:
             response = CompressionSettingsUpdateResponse(
                 success=False, message="Failed to update compression settings."
             )
-    except Exception as e:
+    except Exception:
+        logger.exception("Compression settings update failed")
         response = CompressionSettingsUpdateResponse(
-            success=False, message=f"An error occurred: {str(e)}"
+            success=False, message=ErrorCode.DB_ERROR
         )
     return response
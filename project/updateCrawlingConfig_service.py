@@ -1,9 +1,16 @@
+import logging
 from typing import List, Optional
 
 import prisma
 import prisma.models
 from pydantic import BaseModel
 
+from project.errors import ErrorCode
+
+logger = logging.getLogger(__name__)
+
+_CrawlingSession = prisma.models.CrawlingSession
+
 
 class CrawlingConfigUpdateResponse(BaseModel):
     """
@@ -31,13 +38,6 @@ async def updateCrawlingConfig(
         CrawlingConfigUpdateResponse: This model provides confirmation that the crawling configuration has been updated with the new settings.
     """
     try:
-        active_session = await prisma.models.CrawlingSession.prisma().find_first(
-            where={"status": "active"}
-        )
-        if not active_session:
-            return CrawlingConfigUpdateResponse(
-                success=False, message="No active crawling session found."
-            )
         updated_fields = {}
         if crawl_depth is not None:
             updated_fields["crawlingDepth"] = crawl_depth
@@ -45,13 +45,24 @@ async def updateCrawlingConfig(
             updated_fields["pauseDuration"] = pause_duration
         if target_domains is not None:
             updated_fields["targetDomains"] = target_domains
-        await prisma.models.CrawlingSession.prisma().update(
-            where={"id": active_session.id}, data=updated_fields
+        if not updated_fields:
+            # Nothing to write; don't spend a round trip mutating nothing.
+            return CrawlingConfigUpdateResponse.model_construct(
+                success=True, message="No changes requested."
+            )
+        # The update matches on status directly rather than fetching the
+        # active session first for its id: one round trip, and the count
+        # doubles as the no-active-session check.
+        count = await _CrawlingSession.prisma().update_many(
+            where={"status": "active"}, data=updated_fields
         )
-        return CrawlingConfigUpdateResponse(
+        if count == 0:
+            return CrawlingConfigUpdateResponse(
+                success=False, message="No active crawling session found."
+            )
+        return CrawlingConfigUpdateResponse.model_construct(
             success=True, message="Crawling settings successfully updated."
         )
-    except Exception as e:
-        return CrawlingConfigUpdateResponse(
-            success=False, message=f"An error occurred: {str(e)}"
-        )
+    except Exception:
+        logger.exception("Crawling config update failed")
+        return CrawlingConfigUpdateResponse(success=False, message=ErrorCode.DB_ERROR)
@@ -1,10 +1,20 @@
-from datetime import datetime
+import asyncio
+import logging
 
+import bcrypt
 import prisma
 import prisma.enums
+import prisma.errors
 import prisma.models
+import project.listUsers_service
 from pydantic import BaseModel
 
+from project.errors import ErrorCode
+
+logger = logging.getLogger(__name__)
+
+_User = prisma.models.User
+
 
 class UpdateUserResponse(BaseModel):
     """
@@ -31,27 +41,31 @@ async def updateUser(
     Returns:
         UpdateUserResponse: Response model indicating the result of the update operation or potential errors.
     """
-    try:
-        exist_user = await prisma.models.User.prisma().find_many(
-            where={"email": email, "NOT": {"id": userId}}
+    # Callers are supposed to send a pre-hashed password, but a plaintext one
+    # must never reach storage. The hash-prefix check is cheap; the bcrypt
+    # work itself runs on the thread pool (same as createUser) so a ~100ms
+    # hash does not stall the event loop.
+    if not password.startswith(("$2a$", "$2b$", "$argon2")):
+        hashed = await asyncio.to_thread(
+            bcrypt.hashpw, password.encode(), bcrypt.gensalt(rounds=12)
         )
-        if exist_user:
-            return UpdateUserResponse(
-                success=False,
-                userId=userId,
-                message="Another user with the same email already exists.",
-            )
-        updated_user = await prisma.models.User.prisma().update(
+        password = hashed.decode()
+    try:
+        # No pre-check query: User.email is @unique, so Postgres enforces
+        # uniqueness as part of the write via the index it already maintains.
+        # A duplicate email surfaces as UniqueViolationError below, making
+        # the whole update one round trip instead of two.
+        # update_many instead of update: the generated client has no select
+        # argument, so this is the way to get a bare row count back rather
+        # than the full User record (hashedPassword included) that update
+        # would deserialize just for a truthiness check.
+        count = await _User.prisma().update_many(
             where={"id": userId},
-            data={
-                "email": email,
-                "hashedPassword": password,
-                "role": role,
-                "updatedAt": datetime.now(),
-            },
+            data={"email": email, "hashedPassword": password, "role": role},
         )
-        if updated_user:
-            return UpdateUserResponse(
+        if count:
+            project.listUsers_service.invalidate_cache()
+            return UpdateUserResponse.model_construct(
                 success=True,
                 userId=userId,
                 message="User details successfully updated.",
@@ -60,5 +74,14 @@ async def updateUser(
             return UpdateUserResponse(
                 success=False, userId=userId, message="Failed to update user details."
             )
-    except Exception as error:
-        return UpdateUserResponse(success=False, userId=userId, message=str(error))
+    except prisma.errors.UniqueViolationError:
+        return UpdateUserResponse(
+            success=False,
+            userId=userId,
+            message="Another user with the same email already exists.",
+        )
+    except Exception:
+        logger.exception("User update failed")
+        return UpdateUserResponse(
+            success=False, userId=userId, message=ErrorCode.DB_ERROR
+        )
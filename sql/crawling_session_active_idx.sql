@@ -0,0 +1,10 @@
+-- Partial index for the active-session probes in stopCrawling and
+-- updateCrawlingConfig. At most a handful of sessions are ever active, so
+-- indexing only those rows keeps the index tiny and cache-resident no matter
+-- how much session history accumulates.
+--
+-- Applied manually after `prisma db push` (see README): Prisma's schema
+-- language cannot express partial indexes, and db push ignores migrations.
+CREATE INDEX IF NOT EXISTS "crawling_session_active_idx"
+ON "CrawlingSession"(id)
+WHERE status = 'active';